@@ -1,16 +1,166 @@
 # Imports necessários para o funcionamento da classe quando instanciada
-from statsmodels.tsa.ar_model import AutoReg
-from tabulate import tabulate
 import numpy as np
-import matplotlib.pyplot as plt
-from statsmodels.tsa.api import VAR
-from statsmodels.tsa.stattools import grangercausalitytests, kpss
-from statsmodels.tsa.stattools import adfuller
+from numpy.lib.stride_tricks import sliding_window_view
+from statsmodels.tsa.stattools import acovf, levinson_durbin
+from statsmodels.tsa.adfvalues import mackinnonp
 import pandas as pd
+from scipy import stats
 import warnings
+from functools import lru_cache
 # Ignorar todos os warnings
 warnings.filterwarnings("ignore")
 
+# Per-lag results are kept as structured arrays with one row per lag (row lag - 1)
+GRANGER_DTYPE = np.dtype([('lag', 'i8'), ('p_value_f', 'f8'), ('p_value_chi2', 'f8'), ('p_value_lr', 'f8')])
+METRICS_DTYPE = np.dtype([('lag', 'i8'), ('AIC', 'f8'), ('BIC', 'f8'), ('HQIC', 'f8'), ('FPE', 'f8')])
+
+
+
+@lru_cache(maxsize=128)
+def _adf_pvalue(data):
+    """
+    Cached ADF p-value (constant, AIC lag search up to Schwert's 4*(n/100)^(1/4) lags) for a series given as
+    the raw bytes of a float64 array.
+
+    Reproduces statsmodels' adfuller: the lag search regresses diff(x) on a constant, the lagged level and the
+    lagged differences over a common sample, and since the candidate models are nested, one QR factorization
+    gives every residual sum of squares. The chosen model is refitted on its full sample for the t-statistic.
+    """
+    series = np.frombuffer(data, dtype=np.float64)
+    maxlag = int(np.ceil(4 * (len(series) / 100) ** 0.25))
+    xdiff = np.diff(series)
+
+    # Lag search (AIC) over the common sample
+    nobs = len(xdiff) - maxlag
+    y = xdiff[maxlag:]
+    z = np.column_stack([np.ones(nobs), series[maxlag:-1], _lagged_windows(xdiff[:, None], maxlag).reshape(nobs, maxlag)])
+    q, _ = np.linalg.qr(z)
+    qty = q.T @ y
+    aic = [nobs * (np.log(2 * np.pi * np.sum((y - q[:, :k] @ qty[:k]) ** 2) / nobs) + 1) + 2 * k
+           for k in range(2, maxlag + 3)]
+    bestlag = int(np.argmin(aic))
+
+    # t-statistic of the lagged level in the selected regression
+    nobs = len(xdiff) - bestlag
+    y = xdiff[bestlag:]
+    z = np.column_stack([series[bestlag:-1], _lagged_windows(xdiff[:, None], bestlag).reshape(nobs, bestlag), np.ones(nobs)])
+    q, r = np.linalg.qr(z)
+    r_inv = np.linalg.inv(r)
+    beta = r_inv @ (q.T @ y)
+    sigma2 = np.sum((y - z @ beta) ** 2) / (nobs - z.shape[1])
+    adf_stat = beta[0] / np.sqrt(sigma2 * np.sum(r_inv[0] ** 2))
+    return mackinnonp(adf_stat, regression='c', N=1)
+
+
+
+@lru_cache(maxsize=128)
+def _kpss_pvalue(data):
+    """
+    Cached KPSS p-value (level stationarity, Schwert's 4*(n/100)^(1/4) lags) for a series given as the raw bytes
+    of a float64 array. Reproduces statsmodels' kpss, including its interpolation between the tabulated
+    critical values.
+    """
+    series = np.frombuffer(data, dtype=np.float64)
+    nobs = len(series)
+    nlags = int(4 * (nobs / 100) ** 0.25)
+    resids = series - series.mean()
+
+    # Newey-West long-run variance with Bartlett weights (Kwiatkowski et al. 1992, eq. 10)
+    autocov = np.array([resids[i:] @ resids[:nobs - i] for i in range(1, nlags + 1)])
+    weights = 1.0 - np.arange(1, nlags + 1) / (nlags + 1.0)
+    s_hat = (resids @ resids + 2 * weights @ autocov) / nobs
+
+    eta = np.sum(resids.cumsum() ** 2) / nobs ** 2
+    return np.interp(eta / s_hat, [0.347, 0.463, 0.574, 0.739], [0.10, 0.05, 0.025, 0.01])
+
+
+
+def _format_table(rows, headers):
+    """
+    Formats rows as a plain-text table with a dashed header rule, numbers right-aligned and text left-aligned.
+
+    Returns:
+        list: Lines of the table.
+    """
+    cells = [[f"{v:g}" if isinstance(v, float) else str(v) for v in row] for row in rows]
+    numeric = [not isinstance(v, str) for v in rows[0]]
+    widths = [max(len(h), *(len(row[i]) for row in cells)) for i, h in enumerate(headers)]
+
+    def fmt(values):
+        return "  ".join(v.rjust(w) if num else v.ljust(w) for v, w, num in zip(values, widths, numeric)).rstrip()
+
+    return [fmt(headers), "  ".join("-" * w for w in widths)] + [fmt(row) for row in cells]
+
+
+
+def _lagged_windows(values, lag):
+    """
+    Returns lags 1..lag of every column of a 2-D array for the observations from index lag on.
+
+    The result is a strided view of shape (n - lag, n_columns, lag) whose last axis runs from lag 1 to lag,
+    so no lagged copies are made until the design matrix is assembled.
+    """
+    return sliding_window_view(values, lag + 1, axis=0)[:, :, :lag][:, :, ::-1]
+
+
+
+def _granger_pvalues(y, x, lag):
+    """
+    Computes the Granger causality p-values (SSR F-test, SSR chi-square and likelihood ratio) of x on y for one lag.
+
+    The restricted regressors (constant and lags of y) are the leading columns of the unrestricted design,
+    so both residual sums of squares come from a single QR factorization.
+    """
+    nobs = len(y) - lag
+    y_sample = y[lag:]
+    # Constant, lags of y, lags of x
+    z = np.column_stack([np.ones(nobs), _lagged_windows(np.column_stack([y, x]), lag).reshape(nobs, -1)])
+    q, _ = np.linalg.qr(z)
+    qty = q.T @ y_sample
+    ssr_restricted = np.sum((y_sample - q[:, :lag + 1] @ qty[:lag + 1]) ** 2)
+    ssr_unrestricted = np.sum((y_sample - q @ qty) ** 2)
+
+    # Same statistics as statsmodels' grangercausalitytests
+    df_resid = nobs - z.shape[1]
+    f_stat = (ssr_restricted - ssr_unrestricted) / ssr_unrestricted / lag * df_resid
+    chi2_stat = nobs * (ssr_restricted - ssr_unrestricted) / ssr_unrestricted
+    lr_stat = nobs * np.log(ssr_restricted / ssr_unrestricted)
+    return stats.f.sf(f_stat, lag, df_resid), stats.chi2.sf(chi2_stat, lag), stats.chi2.sf(lr_stat, lag)
+
+
+
+def _nested_var_criteria(values, max_lag):
+    """
+    Computes AIC, BIC, HQIC and FPE of the VAR(1)..VAR(max_lag) models (with constant) over a common sample.
+
+    The regressors of VAR(p) are the leading columns of the VAR(max_lag) design matrix, so a single QR
+    factorization of that matrix gives the residuals of every nested model.
+    """
+    n_totobs, neqs = values.shape
+    nobs = n_totobs - max_lag
+    y_sample = values[max_lag:]
+    # Constant, then all series at lag 1, all series at lag 2, ...
+    lags = _lagged_windows(values, max_lag).transpose(0, 2, 1).reshape(nobs, -1)
+    z = np.column_stack([np.ones(nobs), lags])
+    q, _ = np.linalg.qr(z)
+    qty = q.T @ y_sample
+
+    criteria = np.empty(max_lag, dtype=METRICS_DTYPE)
+    for lag in range(1, max_lag + 1):
+        k = 1 + neqs * lag
+        resid = y_sample - q[:, :k] @ qty[:k]
+        ld = np.linalg.slogdet(resid.T @ resid / nobs)[1]
+        free_params = lag * neqs ** 2 + neqs
+        # Same definitions as statsmodels' VARResults.info_criteria (Lütkepohl pp. 146-150)
+        criteria[lag - 1] = (
+            lag,
+            ld + (2.0 / nobs) * free_params,
+            ld + (np.log(nobs) / nobs) * free_params,
+            ld + (2.0 * np.log(np.log(nobs)) / nobs) * free_params,
+            ((nobs + k) / (nobs - k)) ** neqs * np.exp(ld)
+        )
+    return criteria
+
 
 class GrangerScope:
     """
@@ -21,19 +171,22 @@ class GrangerScope:
         df (pd.DataFrame): DataFrame with two columns 'x' and 'y' for analysis.
         max_lag (int): Maximum lag for the VAR and Granger tests.
         diff_level (int): Level of differentiation applied to achieve stationarity.
-        _results (dict): Stores the outcomes of various tests, including Granger causality and model metrics.
+        _results (dict): Stores the outcomes of various tests, including Granger causality and model metrics,
+            as structured arrays with one row per lag.
         _stationarity_results (dict): Stores the initial results of stationarity tests (ADF, KPSS).
     """
     
 
 
-    def __init__(self, df, max_lag):
+    def __init__(self, df, max_lag, plot=True, report=True):
         """
         Initializes the GrangerVARAnalyzer with a DataFrame and max lag, and runs the full analysis pipeline.
         
         Args:
             df (pd.DataFrame): DataFrame with two columns 'x' and 'y'.
             max_lag (int): Maximum number of lags to be considered in the analysis.
+            plot (bool): Whether to display the plots at the end of the analysis. Defaults to True.
+            report (bool): Whether to print the report at the end of the analysis. Defaults to True.
             
         Raises:
             ValueError: If max_lag exceeds 27% of the DataFrame's length or if 'x' and 'y' columns are not in df.
@@ -45,7 +198,7 @@ class GrangerScope:
         self._stationarity_results = {}
 
         self.validate_lag()
-        self.run_analysis()
+        self.run_analysis(plot=plot, report=report)
 
 
 
@@ -60,17 +213,29 @@ class GrangerScope:
 
     @staticmethod
     def adf_test(series):
-        """Executes the ADF test and returns the p-value."""
-        result = adfuller(series)
-        return result[1]
+        """Executes the ADF test and returns the p-value (cached on the series values)."""
+        return _adf_pvalue(np.asarray(series, dtype=np.float64).tobytes())
 
 
 
     @staticmethod
     def kpss_test(series):
-        """Executes the KPSS test and returns the p-value."""
-        result = kpss(series, regression='c', nlags="auto")
-        return result[1]
+        """Executes the KPSS test and returns the p-value (cached on the series values)."""
+        return _kpss_pvalue(np.asarray(series, dtype=np.float64).tobytes())
+
+
+
+    def _is_non_stationary(self, series):
+        """
+        Applies the stationarity gate (ADF p-value > 0.05 or KPSS p-value < 0.05) to a series.
+
+        The cheap variance ratio var(diff(series)) / var(series) only decides which test runs first: a strongly
+        persistent series (ratio below 0.5) usually fails KPSS, so KPSS goes first and ADF is skipped when it
+        rejects; otherwise ADF goes first. The outcome is the same either way.
+        """
+        if np.var(np.diff(series)) < 0.5 * np.var(series):
+            return self.kpss_test(series) < 0.05 or self.adf_test(series) > 0.05
+        return self.adf_test(series) > 0.05 or self.kpss_test(series) < 0.05
 
 
 
@@ -82,9 +247,12 @@ class GrangerScope:
             pd.DataFrame: Differentiated series DataFrame.
             int: Number of differences applied.
         """
+        # Work on a plain array so the differencing loop avoids per-iteration DataFrame overhead
+        values = self.df[['x', 'y']].to_numpy(dtype=np.float64)
+
         # Initial stationarity tests
-        adf_x, adf_y = self.adf_test(self.df['x']), self.adf_test(self.df['y'])
-        kpss_x, kpss_y = self.kpss_test(self.df['x']), self.kpss_test(self.df['y'])
+        adf_x, adf_y = self.adf_test(values[:, 0]), self.adf_test(values[:, 1])
+        kpss_x, kpss_y = self.kpss_test(values[:, 0]), self.kpss_test(values[:, 1])
         x_non_stationary, y_non_stationary = adf_x > 0.05 or kpss_x < 0.05, adf_y > 0.05 or kpss_y < 0.05
 
         # Store initial stationarity results
@@ -95,13 +263,17 @@ class GrangerScope:
 
         # Differencing until stationarity
         diff_level = 0
-        df_diff = self.df.copy()
         while x_non_stationary or y_non_stationary:
-            df_diff = df_diff.diff().dropna()
+            values = np.diff(values, axis=0)
             diff_level += 1
-            x_non_stationary = self.adf_test(df_diff['x']) > 0.05 or self.kpss_test(df_diff['x']) < 0.05
-            y_non_stationary = self.adf_test(df_diff['y']) > 0.05 or self.kpss_test(df_diff['y']) < 0.05
-
+            # Only re-test the series that were still non-stationary
+            if x_non_stationary:
+                x_non_stationary = self._is_non_stationary(values[:, 0])
+            if y_non_stationary:
+                y_non_stationary = self._is_non_stationary(values[:, 1])
+
+        # Rebuild the DataFrame once for the downstream Granger and VAR steps
+        df_diff = pd.DataFrame(values, columns=['x', 'y'], index=self.df.index[diff_level:])
         self.diff_level = diff_level
         return df_diff, diff_level
 
@@ -115,17 +287,14 @@ class GrangerScope:
             df_stationary (pd.DataFrame): Stationary version of the original data after differencing.
 
         Returns:
-            dict: Dictionary with p-values for each test (F-test, Chi-square, Likelihood Ratio).
+            np.ndarray: Structured array (GRANGER_DTYPE) with the lag and the p-values of each test
+            (F-test, Chi-square, Likelihood Ratio), one row per lag.
         """
-        granger_results = {}
+        granger_results = np.empty(self.max_lag, dtype=GRANGER_DTYPE)
         
+        y_values, x_values = df_stationary['y'].to_numpy(), df_stationary['x'].to_numpy()
         for lag in range(1, self.max_lag + 1):
-            test_result = grangercausalitytests(df_stationary[['y', 'x']], maxlag=lag, verbose=False)
-            granger_results[lag] = {
-                'p_value_f': test_result[lag][0]['ssr_ftest'][1],
-                'p_value_chi2': test_result[lag][0]['ssr_chi2test'][1],
-                'p_value_lr': test_result[lag][0]['lrtest'][1]
-            }
+            granger_results[lag - 1] = (lag, *_granger_pvalues(y_values, x_values, lag))
         
         self._results['granger'] = granger_results
         return granger_results
@@ -140,30 +309,32 @@ class GrangerScope:
             df_stationary (pd.DataFrame): Stationary version of the original data after differencing.
 
         Returns:
-            dict: Dictionary with model metrics for both restricted and unrestricted models.
+            dict: Structured arrays (METRICS_DTYPE) with the model metrics per lag for both restricted and
+            unrestricted models.
         """
-        var_metrics = {'restricted': {}, 'unrestricted': {}}
+        # Unrestricted VAR models with lags of x and y, all derived from one factorization of the
+        # max_lag design matrix and evaluated over the same sample
+        unrestricted = _nested_var_criteria(df_stationary[['x', 'y']].to_numpy(), self.max_lag)
         
+        # Restricted AR models with only lags of y: the nested AR(1)..AR(max_lag) fits all come out of
+        # one Levinson-Durbin recursion on the autocovariance of y (sigma2[p] is the AR(p) residual variance)
+        y_values = df_stationary['y'].to_numpy()
+        sigma2 = levinson_durbin(acovf(y_values, nlag=self.max_lag, fft=False), nlags=self.max_lag, isacov=True)[3]
+        restricted = np.empty(self.max_lag, dtype=METRICS_DTYPE)
         for lag in range(1, self.max_lag + 1):
-            # Unrestricted VAR model with lags of x and y
-            model_irrestrito = VAR(df_stationary).fit(lag)
-            var_metrics['unrestricted'][lag] = {
-                'AIC': model_irrestrito.aic,
-                'BIC': model_irrestrito.bic,
-                'HQIC': model_irrestrito.hqic,
-                'FPE': model_irrestrito.fpe
-            }
-            
-            # Restricted AR model with only lags of y
-            y_series = df_stationary['y']
-            model_restrito = AutoReg(y_series, lags=lag).fit()
-            var_metrics['restricted'][lag] = {
-                'AIC': model_restrito.aic,
-                'BIC': model_restrito.bic,
-                'HQIC': model_restrito.hqic,
-                'FPE': model_restrito.sigma2
-            }
+            # Same conventions as AutoReg: nobs = n - lag and lag coefficients + constant + variance as parameters
+            nobs = len(y_values) - lag
+            n_params = lag + 2
+            llf = -nobs / 2 * (np.log(2 * np.pi * sigma2[lag]) + 1)
+            restricted[lag - 1] = (
+                lag,
+                -2 * llf + 2 * n_params,
+                -2 * llf + np.log(nobs) * n_params,
+                -2 * llf + 2 * np.log(np.log(nobs)) * n_params,
+                sigma2[lag]
+            )
         
+        var_metrics = {'restricted': restricted, 'unrestricted': unrestricted}
         self._results['var_metrics'] = var_metrics
         return var_metrics
     
@@ -171,107 +342,106 @@ class GrangerScope:
     
     def generate_report(self):
         """Generates a detailed report of stationarity tests, Granger causality, and model selection criteria."""
-        
-        print("RESULTADOS DA ANÁLISE DE GRANGER E LAG ÓTIMO")
-        print(" ")
+        # The report is buffered and printed at once
+        lines = ["RESULTADOS DA ANÁLISE DE GRANGER E LAG ÓTIMO", " "]
         
         # Stationarity test results
-        print("Resultados dos Testes de Estacionaridade Iniciais (ADF e KPSS)")
+        lines.append("Resultados dos Testes de Estacionaridade Iniciais (ADF e KPSS)")
         stationarity_data = [
             ["x", self._stationarity_results['x']['ADF p-value'], self._stationarity_results['x']['KPSS p-value'], 
              "Não Estacionária" if self._stationarity_results['x']['Non-Stationary'] else "Estacionária"],
             ["y", self._stationarity_results['y']['ADF p-value'], self._stationarity_results['y']['KPSS p-value'], 
              "Não Estacionária" if self._stationarity_results['y']['Non-Stationary'] else "Estacionária"]
         ]
-        print(tabulate(stationarity_data, headers=["Série", "ADF p-valor", "KPSS p-valor", "Estacionaridade"]))
+        lines += _format_table(stationarity_data, ["Série", "ADF p-valor", "KPSS p-valor", "Estacionaridade"])
         
         # Differentiation level
         if self.diff_level > 0:
-            print(f"\nNúmero de diferenciações aplicadas para tornar as séries estacionárias: {self.diff_level}")
+            lines.append(f"\nNúmero de diferenciações aplicadas para tornar as séries estacionárias: {self.diff_level}")
         else:
-            print("\nAs séries já eram estacionárias, sem necessidade de diferenciação.")
+            lines.append("\nAs séries já eram estacionárias, sem necessidade de diferenciação.")
         
         # Granger test results
-        granger_data = []
-        for lag, res in self._results['granger'].items():
-            if res['p_value_f'] < 0.05 or res['p_value_chi2'] < 0.05:
-                granger_data.append([lag, res['p_value_f'], res['p_value_chi2']])
+        granger = self._results['granger']
+        significant = granger[(granger['p_value_f'] < 0.05) | (granger['p_value_chi2'] < 0.05)]
+        granger_data = [[int(row['lag']), row['p_value_f'], row['p_value_chi2']] for row in significant]
         if not granger_data:
-            print("\nNenhum lag apresentou p-valor significativo no teste de Granger.")
+            lines.append("\nNenhum lag apresentou p-valor significativo no teste de Granger.")
         else:
-            print("\nResultados do Teste de Granger (Lags Significativos)")
-            print(tabulate(granger_data, headers=["Lag", "p-valor F", "p-valor Chi-Square"]))
+            lines.append("\nResultados do Teste de Granger (Lags Significativos)")
+            lines += _format_table(granger_data, ["Lag", "p-valor F", "p-valor Chi-Square"])
         
         # Optimal lags based on criteria
         if granger_data:
-            optimal_lags = {
-                'AIC': min(granger_data, key=lambda x: self._results['var_metrics']['unrestricted'][x[0]]['AIC'])[0],
-                'BIC': min(granger_data, key=lambda x: self._results['var_metrics']['unrestricted'][x[0]]['BIC'])[0],
-                'HQIC': min(granger_data, key=lambda x: self._results['var_metrics']['unrestricted'][x[0]]['HQIC'])[0],
-                'FPE': min(granger_data, key=lambda x: self._results['var_metrics']['unrestricted'][x[0]]['FPE'])[0]
-            }
+            sig_metrics = self._results['var_metrics']['unrestricted'][significant['lag'] - 1]
+            optimal_lags = {criterion: int(sig_metrics['lag'][np.argmin(sig_metrics[criterion])])
+                            for criterion in ['AIC', 'BIC', 'HQIC', 'FPE']}
             adjusted_lags = {criterion: lag + self.diff_level for criterion, lag in optimal_lags.items()}
             report_data = [[criterion, optimal_lags[criterion], adjusted_lag] for criterion, adjusted_lag in adjusted_lags.items()]
-            print("\nLags Ótimos Baseados em Critérios de Informação (Apenas Lags Significativos)")
-            print(tabulate(report_data, headers=["Critério", "Lag Ótimo", "Lag Ajustado"]))
+            lines.append("\nLags Ótimos Baseados em Critérios de Informação (Apenas Lags Significativos)")
+            lines += _format_table(report_data, ["Critério", "Lag Ótimo", "Lag Ajustado"])
+
+        print("\n".join(lines))
 
 
 
 
     def plot_results(self):
-        """Plots p-values and model metrics for analysis."""
+        """Plots p-values and model metrics for analysis in a single figure."""
+        # Imported here so that the analysis alone (plot=False) never loads matplotlib
+        import matplotlib.pyplot as plt
+
+        granger = self._results['granger']
+        unrestricted = self._results['var_metrics']['unrestricted']
+        restricted = self._results['var_metrics']['restricted']
+        lags = granger['lag']
+
+        fig, ax = plt.subplots(3, 1, figsize=(10, 18))
+
         # Plot of p-values for the Granger test
-        lags = list(self._results['granger'].keys())
-        p_values_f = [self._results['granger'][lag]['p_value_f'] for lag in lags]
-        p_values_chi2 = [self._results['granger'][lag]['p_value_chi2'] for lag in lags]
-        
-        plt.figure(figsize=(10, 6))
-        plt.plot(lags, p_values_f, label='p-valor F-test')
-        plt.plot(lags, p_values_chi2, label='p-valor Chi-Square')
-        plt.axhline(0.05, color='red', linestyle='--')
-        plt.xlabel('Número de Lags')
-        plt.ylabel('P-valor')
-        plt.legend()
-        plt.title('P-valores para Testes de Granger')
-        plt.show()
-        
+        ax[0].plot(lags, granger['p_value_f'], label='p-valor F-test')
+        ax[0].plot(lags, granger['p_value_chi2'], label='p-valor Chi-Square')
+        ax[0].axhline(0.05, color='red', linestyle='--')
+        ax[0].set_xlabel('Número de Lags')
+        ax[0].set_ylabel('P-valor')
+        ax[0].legend()
+        ax[0].set_title('P-valores para Testes de Granger')
+
         # Plot of model information criteria
-        aic = [self._results['var_metrics']['unrestricted'][lag]['AIC'] for lag in lags]
-        bic = [self._results['var_metrics']['unrestricted'][lag]['BIC'] for lag in lags]
-        hqic = [self._results['var_metrics']['unrestricted'][lag]['HQIC'] for lag in lags]
-        
-        plt.figure(figsize=(10, 6))
-        plt.plot(lags, aic, label='AIC')
-        plt.plot(lags, bic, label='BIC')
-        plt.plot(lags, hqic, label='HQIC')
-        plt.xlabel('Número de Lags')
-        plt.ylabel('Critério')
-        plt.legend()
-        plt.title('Critérios de Informação')
-        plt.show()
-        
+        ax[1].plot(lags, unrestricted['AIC'], label='AIC')
+        ax[1].plot(lags, unrestricted['BIC'], label='BIC')
+        ax[1].plot(lags, unrestricted['HQIC'], label='HQIC')
+        ax[1].set_xlabel('Número de Lags')
+        ax[1].set_ylabel('Critério')
+        ax[1].legend()
+        ax[1].set_title('Critérios de Informação')
+
         # Plot of FPE for restricted and unrestricted models
-        fpe_restrito = [self._results['var_metrics']['restricted'][lag]['FPE'] for lag in lags]
-        fpe_irrestrito = [self._results['var_metrics']['unrestricted'][lag]['FPE'] for lag in lags]
-        
-        plt.figure(figsize=(10, 6))
-        plt.plot(lags, fpe_restrito, label='FPE Restrito')
-        plt.plot(lags, fpe_irrestrito, label='FPE Irrestrito')
-        plt.xlabel('Número de Lags')
-        plt.ylabel('FPE')
-        plt.legend()
-        plt.title('FPE para Modelos Restritos e Irrestritos')
+        ax[2].plot(lags, restricted['FPE'], label='FPE Restrito')
+        ax[2].plot(lags, unrestricted['FPE'], label='FPE Irrestrito')
+        ax[2].set_xlabel('Número de Lags')
+        ax[2].set_ylabel('FPE')
+        ax[2].legend()
+        ax[2].set_title('FPE para Modelos Restritos e Irrestritos')
+
+        fig.tight_layout()
         plt.show()
 
 
 
-    def run_analysis(self):
+    def run_analysis(self, plot=True, report=True):
         """
         Executes the full analysis pipeline: stationarity tests, Granger causality, VAR model fitting,
         and generates plots and reports.
+
+        Args:
+            plot (bool): Whether to display the plots. Defaults to True.
+            report (bool): Whether to print the report. Defaults to True.
         """
         df_stationary, _ = self.check_stationarity_and_diff()
         self.granger_test(df_stationary)
         self.fit_var_models(df_stationary)
-        self.generate_report()
-        self.plot_results()
+        if report:
+            self.generate_report()
+        if plot:
+            self.plot_results()